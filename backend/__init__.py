@@ -3,23 +3,44 @@ Backend DatavizFT - Module principal
 Architecture modulaire pour les pipelines de données
 """
 
-# Exports principaux depuis les nouveaux modules
-from .clients import FranceTravailAPIClient
-from .data import (
-    CATEGORIES_COMPETENCES,
-    COMPETENCES_REFERENTIEL,
-    NB_CATEGORIES,
-    NB_COMPETENCES_TOTAL,
-)
+import importlib
+from typing import Any
+
+# Exports chargés à la demande (PEP 562) : importer un sous-module comme
+# backend.tools.logging_config ne charge plus httpx, les pipelines, etc.
+_LAZY_EXPORTS = {
+    # Référentiel de compétences
+    "COMPETENCES_REFERENTIEL": ".data",
+    "CATEGORIES_COMPETENCES": ".data",
+    "NB_CATEGORIES": ".data",
+    "NB_COMPETENCES_TOTAL": ".data",
+    # Pipelines
+    "PipelineM1805": ".pipelines",
+    "run_pipelineFT": ".pipelines",
+    "run_pipeline_avec_limite": ".pipelines",
+    "lister_pipelines_disponibles": ".pipelines",
+    # Outils essentiels
+    "FranceTravailAPIClient": ".clients",
+    "CompetenceAnalyzer": ".tools",
+    "FileManager": ".tools",
+    "charger_config_pipeline": ".tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Importe l'export demandé au premier accès puis le met en cache"""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# Exports principaux depuis pipelines
-from .pipelines import (
-    PipelineM1805,
-    lister_pipelines_disponibles,
-    run_pipeline_avec_limite,
-    run_pipelineFT,
-)
-from .tools import CompetenceAnalyzer, FileManager, charger_config_pipeline
 
 # API publique simplifiée
 __all__ = [
@@ -54,6 +75,9 @@ def info_systeme():
     Returns:
         Dict avec les informations système
     """
+    from .data import NB_CATEGORIES, NB_COMPETENCES_TOTAL
+    from .pipelines import lister_pipelines_disponibles
+
     return {
         "version": __version__,
         "description": __description__,
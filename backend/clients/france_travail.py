@@ -3,10 +3,12 @@ API Client - Client générique pour les APIs de France Travail
 Gestion de l'authentification, pagination, rate limiting
 """
 
+import logging
 import time
 from typing import Any
 
 import httpx
+import orjson
 
 from ..config import (
     API_BASE_URL,
@@ -27,6 +29,31 @@ class FranceTravailAPIClient:
         self.base_url = API_BASE_URL
         self._headers: dict[str, str] | None = None
         self._token: str | None = None
+        self._http: httpx.Client | None = None
+        self.logger = logging.getLogger(__name__)
+
+    def __enter__(self) -> "FranceTravailAPIClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _get_http(self) -> httpx.Client:
+        """
+        Obtient le client HTTP persistant (créé à la première requête)
+
+        Le pool de connexions est partagé entre toutes les pages : une seule
+        poignée de main TCP+TLS par hôte au lieu d'une par requête.
+        """
+        if self._http is None:
+            self._http = httpx.Client()
+        return self._http
+
+    def close(self) -> None:
+        """Ferme le client HTTP persistant et libère ses connexions"""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     def _get_token(self) -> str:
         """Obtient un token d'authentification OAuth2 pour l'API France Travail"""
@@ -42,7 +69,8 @@ class FranceTravailAPIClient:
             )
 
         try:
-            response = httpx.post(
+            # Même client persistant que la collecte (fermé avec lui)
+            response = self._get_http().post(
                 TOKEN_URL,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
                 data={
@@ -65,7 +93,7 @@ class FranceTravailAPIClient:
                 )
 
             response.raise_for_status()
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             print("Token received successfully")
             self._token = token_data["access_token"]
             return self._token
@@ -127,7 +155,9 @@ class FranceTravailAPIClient:
         headers = self._get_headers()
 
         # Requête avec range minimal pour obtenir le total
-        response = httpx.get(url, headers=headers, params={**params, "range": "0-0"})
+        response = self._get_http().get(
+            url, headers=headers, params={**params, "range": "0-0"}
+        )
 
         if response.status_code not in [200, 206]:
             raise Exception(f"Erreur API: {response.status_code} - {response.text}")
@@ -135,6 +165,31 @@ class FranceTravailAPIClient:
         content_range = response.headers.get("Content-Range", "")
         return self._parse_content_range(content_range)
 
+    def _respecter_rate_limit(self, debut_requete: float) -> None:
+        """
+        Attend le reliquat de la fenêtre de rate limiting
+
+        Args:
+            debut_requete: Instant (time.monotonic) du début de la requête précédente
+        """
+        # La durée de la requête elle-même compte dans l'espacement
+        reliquat = self.rate_limit_ms / 1000.0 - (time.monotonic() - debut_requete)
+        if reliquat > 0:
+            time.sleep(reliquat)
+
+    def _log_page(
+        self, page: int, nb_pages: int, range_param: str, offres: list[dict[str, Any]]
+    ) -> None:
+        """Détail par page, uniquement en DEBUG (évite le formatage en boucle)"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Page %d/%d (range=%s): %d offres collectées au total",
+                page,
+                nb_pages,
+                range_param,
+                len(offres),
+            )
+
     def collecter_offres_paginees(
         self,
         params: dict[str, Any],
@@ -155,8 +210,30 @@ class FranceTravailAPIClient:
         print("🚀 DÉBUT COLLECTE AVEC PAGINATION")
         print("=" * 50)
 
-        # Obtenir le total disponible
-        total_disponible = self.obtenir_total_offres(params)
+        page_size = min(page_size, 150)  # Limite API
+        url = f"{self.base_url}/offres/search"
+        headers = self._get_headers()
+
+        # La première page fournit aussi le total (Content-Range) :
+        # pas d'appel dédié range=0-0 avant la pagination
+        taille_premiere_page = min(page_size, max_offres) if max_offres else page_size
+        debut_requete = time.monotonic()
+        http = self._get_http()
+        response = http.get(
+            url,
+            headers=headers,
+            params={**params, "range": f"0-{taille_premiere_page - 1}"},
+        )
+
+        if response.status_code == 204:
+            print("📊 0 offres disponibles")
+            return []
+        if response.status_code not in [200, 206]:
+            raise Exception(f"Erreur API: {response.status_code} - {response.text}")
+
+        total_disponible = self._parse_content_range(
+            response.headers.get("Content-Range", "")
+        )
         total_a_collecter = min(total_disponible, max_offres or total_disponible)
 
         print(f"📊 {total_disponible} offres disponibles")
@@ -164,45 +241,37 @@ class FranceTravailAPIClient:
             print(f"🎯 Limite fixée à {max_offres} offres")
         print(f"📥 Collecte de {total_a_collecter} offres")
 
-        # Configuration pagination
-        page_size = min(page_size, 150)  # Limite API
         nb_pages = (total_a_collecter + page_size - 1) // page_size
 
         print(f"📄 Collecte en {nb_pages} pages de {page_size} offres max")
 
         # Collecte paginée
-        toutes_offres = []
-        url = f"{self.base_url}/offres/search"
-        headers = self._get_headers()
+        toutes_offres = orjson.loads(response.content).get("resultats", [])
+        self._log_page(1, nb_pages, f"0-{taille_premiere_page - 1}", toutes_offres)
+
+        for page in range(1, nb_pages):
+            # Arrêt si limite atteinte
+            if len(toutes_offres) >= total_a_collecter:
+                break
+
+            self._respecter_rate_limit(debut_requete)
 
-        for page in range(nb_pages):
             start = page * page_size
             end = min(start + page_size - 1, total_a_collecter - 1)
             range_param = f"{start}-{end}"
 
-            print(f"   📄 Page {page + 1}/{nb_pages}: range={range_param}")
-
             params_page = {**params, "range": range_param}
-            response = httpx.get(url, headers=headers, params=params_page)
+            debut_requete = time.monotonic()
+            response = http.get(url, headers=headers, params=params_page)
 
             if response.status_code in [200, 206]:
-                data = response.json()
-                offres_page = data.get("resultats", [])
+                offres_page = orjson.loads(response.content).get("resultats", [])
                 toutes_offres.extend(offres_page)
-                print(
-                    f"   ✅ {len(offres_page)} offres collectées (total: {len(toutes_offres)})"
-                )
-
-                # Arrêt si limite atteinte
-                if len(toutes_offres) >= total_a_collecter:
-                    break
+                self._log_page(page + 1, nb_pages, range_param, toutes_offres)
             else:
                 print(f"   ❌ Erreur page {page + 1}: {response.status_code}")
                 # Continuer malgré l'erreur pour les autres pages
 
-            # Rate limiting
-            time.sleep(self.rate_limit_ms / 1000.0)
-
         print(f"\n🎯 COLLECTE TERMINÉE: {len(toutes_offres)} offres")
         return toutes_offres
 
@@ -246,5 +315,5 @@ def collecter_toutes_offres_m1805() -> list[dict[str, Any]]:
     Returns:
         Liste complète des offres M1805
     """
-    client = FranceTravailAPIClient()
-    return client.collecter_offres_par_code_rome("M1805")
+    with FranceTravailAPIClient() as client:
+        return client.collecter_offres_par_code_rome("M1805")
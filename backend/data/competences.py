@@ -3,9 +3,10 @@ Compétences - Référentiel des compétences techniques
 Chargement et exposition du référentiel de compétences depuis competences.json
 """
 
-import json
 from pathlib import Path
 
+import orjson
+
 
 def charger_competences_referentiel() -> dict[str, list[str]]:
     """
@@ -16,16 +17,15 @@ def charger_competences_referentiel() -> dict[str, list[str]]:
 
     Raises:
         FileNotFoundError: Si le fichier competences.json n'existe pas
-        json.JSONDecodeError: Si le fichier JSON est malformé
+        orjson.JSONDecodeError: Si le fichier JSON est malformé
     """
     try:
         chemin_competences = Path(__file__).parent / "competences.json"
-        with open(chemin_competences, encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(chemin_competences.read_bytes())
     except FileNotFoundError:
         print("❌ Fichier competences.json non trouvé dans backend/data/")
         return {}
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"❌ Erreur de parsing JSON: {e}")
         return {}
 
@@ -3,10 +3,11 @@ Database Connection - Gestion des connexions MongoDB
 Centralise la configuration et l'initialisation de MongoDB
 """
 
+import asyncio
 import os
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from pymongo import MongoClient
+from pymongo import ASCENDING, DESCENDING, GEOSPHERE, IndexModel, MongoClient
 from pymongo.database import Database
 
 
@@ -24,6 +25,13 @@ class DatabaseConnection:
             "MONGODB_URL", "mongodb://localhost:27017"
         )
         self.database_name = os.getenv("MONGODB_DATABASE", "dataviz_ft")
+        # Compression réseau négociée avec le serveur (zlib : sans dépendance,
+        # "zstd,zlib" possible si le module zstandard est installé)
+        self.compressors = os.getenv("MONGODB_COMPRESSORS", "zlib")
+        # Pool du client asynchrone : quelques connexions ouvertes d'avance
+        # pour les écritures concurrentes (asyncio.gather des lots)
+        self.max_pool_size = int(os.getenv("MONGODB_MAX_POOL_SIZE", "100"))
+        self.min_pool_size = int(os.getenv("MONGODB_MIN_POOL_SIZE", "4"))
 
         # Clients (initialisés à None)
         self._async_client: AsyncIOMotorClient | None = None
@@ -35,14 +43,21 @@ class DatabaseConnection:
     def async_client(self) -> AsyncIOMotorClient:
         """Client MongoDB asynchrone (Motor)"""
         if self._async_client is None:
-            self._async_client = AsyncIOMotorClient(self.connection_string)
+            self._async_client = AsyncIOMotorClient(
+                self.connection_string,
+                compressors=self.compressors,
+                maxPoolSize=self.max_pool_size,
+                minPoolSize=self.min_pool_size,
+            )
         return self._async_client
 
     @property
     def sync_client(self) -> MongoClient:
         """Client MongoDB synchrone (PyMongo)"""
         if self._sync_client is None:
-            self._sync_client = MongoClient(self.connection_string)
+            self._sync_client = MongoClient(
+                self.connection_string, compressors=self.compressors
+            )
         return self._sync_client
 
     @property
@@ -109,45 +124,59 @@ class DatabaseConnection:
         """Crée les index optimaux pour les collections"""
         db = self.async_db
 
-        # Index pour collection offres
-        await db.offres.create_index(
-            [("source_id", 1)], unique=True, name="idx_source_id"  # Unique ID source
-        )
-
-        await db.offres.create_index(
-            [("date_creation", -1)],  # Tri par date création desc
-            name="idx_date_creation",
-        )
-
-        await db.offres.create_index(
-            [("competences_extraites", 1)],  # Recherche par compétences
-            name="idx_competences",
-        )
-
-        await db.offres.create_index(
-            [
-                ("localisation.departement", 1),  # Recherche géographique
-                ("date_creation", -1),
-            ],
-            name="idx_geo_date",
-        )
-
-        # Index géospatial si coordonnées présentes
-        await db.offres.create_index(
-            [("localisation.coordinates", "2dsphere")],
-            name="idx_geo_coords",
-            sparse=True,
-        )
-
-        # Index pour collection stats_competences
-        await db.stats_competences.create_index(
-            [("competence", 1), ("periode", 1)],
-            unique=True,
-            name="idx_competence_periode",
-        )
-
-        await db.stats_competences.create_index(
-            [("date_analyse", -1)], name="idx_date_analyse"
+        # Un seul createIndexes par collection (index construits ensemble),
+        # les collections étant traitées en parallèle
+        await asyncio.gather(
+            db.offres.create_indexes(
+                [
+                    # Unique ID source
+                    IndexModel(
+                        [("source_id", ASCENDING)], unique=True, name="idx_source_id"
+                    ),
+                    IndexModel(
+                        [("date_creation", DESCENDING)],  # Tri par date création desc
+                        name="idx_date_creation",
+                    ),
+                    # Recherche par compétences
+                    IndexModel(
+                        [("competences_extraites", ASCENDING)], name="idx_competences"
+                    ),
+                    # Recherche géographique
+                    IndexModel(
+                        [
+                            ("localisation.departement", ASCENDING),
+                            ("date_creation", DESCENDING),
+                        ],
+                        name="idx_geo_date",
+                    ),
+                    # Index géospatial si coordonnées présentes
+                    IndexModel(
+                        [("localisation.coordinates", GEOSPHERE)],
+                        name="idx_geo_coords",
+                        sparse=True,
+                    ),
+                ]
+            ),
+            db.stats_competences.create_indexes(
+                [
+                    IndexModel(
+                        [("competence", ASCENDING), ("periode", ASCENDING)],
+                        unique=True,
+                        name="idx_competence_periode",
+                    ),
+                    IndexModel([("date_analyse", DESCENDING)], name="idx_date_analyse"),
+                ]
+            ),
+            # Clé de recherche des mises à jour de popularité (bulk_write)
+            db.competences.create_indexes(
+                [
+                    IndexModel(
+                        [("nom_normalise", ASCENDING)],
+                        unique=True,
+                        name="idx_nom_normalise",
+                    ),
+                ]
+            ),
         )
 
         print("📊 Index MongoDB créés avec succès")
@@ -162,12 +191,12 @@ class DatabaseConnection:
 
             for coll_name in collections:
                 coll = db[coll_name]
+                # Compte lu dans les métadonnées (pas de scan de la collection)
+                count = coll.estimated_document_count()
                 info["collections"][coll_name] = {
-                    "count": coll.count_documents({}),
+                    "count": count,
                     "indexes": len(list(coll.list_indexes())),
-                    "size_mb": round(
-                        coll.estimated_document_count() * 0.001, 2
-                    ),  # Estimation
+                    "size_mb": round(count * 0.001, 2),  # Estimation
                 }
 
             return info
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Any
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo import DESCENDING
+from pymongo import DESCENDING, UpdateOne
 
 from ...models.competence import CompetenceDetectee, CompetenceModel
 
@@ -37,7 +37,7 @@ class CompetencesRepository:
             ID de la compétence créée
         """
         try:
-            competence_dict = competence.dict()
+            competence_dict = competence.model_dump()
             result = await self.collection.insert_one(competence_dict)
             return str(result.inserted_id)
         except Exception as e:
@@ -149,7 +149,7 @@ class CompetencesRepository:
         try:
             detection_doc = {
                 "offre_id": offre_id,
-                "competences": [comp.dict() for comp in competences_detectees],
+                "competences": [comp.model_dump() for comp in competences_detectees],
                 "date_detection": datetime.now(),
                 "nb_competences": len(competences_detectees),
             }
@@ -217,7 +217,11 @@ class CompetencesRepository:
             Statistiques de synchronisation
         """
         # Agrégation pour compter les détections par compétence
+        # $match/$project avant $unwind : seules les détections non vides,
+        # réduites au tableau utile, passent dans le pipeline
         pipeline = [
+            {"$match": {"competences": {"$exists": True, "$ne": []}}},
+            {"$project": {"_id": 0, "competences": 1}},
             {"$unwind": "$competences"},
             {
                 "$group": {
@@ -229,21 +233,33 @@ class CompetencesRepository:
             {"$sort": {"nb_detections": DESCENDING}},
         ]
 
-        cursor = self.collection_detections.aggregate(pipeline)
+        cursor = self.collection_detections.aggregate(pipeline, allowDiskUse=True)
         stats_detections = await cursor.to_list(length=None)
 
-        # Mise à jour des popularités
-        updates_count = 0
-        for stat in stats_detections:
-            competence_nom = stat["_id"]
-            nouvelle_popularite = min(
-                stat["confiance_moyenne"] * stat["nb_detections"] / 1000, 1.0
+        # Mise à jour des popularités : un seul bulk_write non ordonné
+        # plutôt qu'un update_one (et un aller-retour) par compétence
+        operations = [
+            UpdateOne(
+                {"nom_normalise": stat["_id"].lower()},
+                {
+                    "$set": {
+                        "popularite": min(
+                            stat["confiance_moyenne"] * stat["nb_detections"] / 1000,
+                            1.0,
+                        )
+                    }
+                },
             )
+            for stat in stats_detections
+        ]
 
-            if await self.update_popularite_competence(
-                competence_nom, nouvelle_popularite
-            ):
-                updates_count += 1
+        updates_count = 0
+        if operations:
+            try:
+                result = await self.collection.bulk_write(operations, ordered=False)
+                updates_count = result.modified_count
+            except Exception as e:
+                print(f"❌ Erreur mise à jour popularités: {e}")
 
         return {
             "competences_analysees": len(stats_detections),
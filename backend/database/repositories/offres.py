@@ -3,15 +3,52 @@ Repository Offres - Accès aux données des offres d'emploi
 Gestion CRUD et requêtes avancées pour les offres MongoDB
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo import DESCENDING
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from ...models.offre import OffreEmploiModel
 
+# Taille des lots pour insert_many (latence d'insertion bornée par lot)
+_TAILLE_LOT_INSERTION = 1000
+# Lots en cours simultanément (bornant aussi les dicts convertis en mémoire)
+_LOTS_SIMULTANES = 4
+# Code serveur MongoDB d'une violation d'index unique
+_CODE_CLE_DUPLIQUEE = 11000
+
+# Documents de requête constants : construits une seule fois au chargement du module
+# Format de groupe selon la granularité (get_stats_temporelles)
+_GROUP_FORMATS: dict[str, dict[str, Any]] = {
+    "day": {
+        "year": {"$year": "$date_creation"},
+        "month": {"$month": "$date_creation"},
+        "day": {"$dayOfMonth": "$date_creation"},
+    },
+    "week": {
+        "year": {"$year": "$date_creation"},
+        "week": {"$week": "$date_creation"},
+    },
+    "month": {
+        "year": {"$year": "$date_creation"},
+        "month": {"$month": "$date_creation"},
+    },
+}
+
+_PIPELINE_DERNIERE_OFFRE: list[dict[str, Any]] = [
+    {"$sort": {"date_creation": DESCENDING}},
+    {"$limit": 1},
+]
+
+_PIPELINE_REPARTITION_MENSUELLE: list[dict[str, Any]] = [
+    {"$group": {"_id": _GROUP_FORMATS["month"], "count": {"$sum": 1}}},
+    {"$sort": {"_id": DESCENDING}},
+    {"$limit": 12},
+]
+
 
 class OffresRepository:
     """Repository pour les offres d'emploi MongoDB"""
@@ -38,7 +75,7 @@ class OffresRepository:
         """
         try:
             # Conversion en dict avec validation Pydantic
-            offre_dict = offre.dict()
+            offre_dict = offre.model_dump()
 
             result = await self.collection.insert_one(offre_dict)
             return str(result.inserted_id)
@@ -63,19 +100,64 @@ class OffresRepository:
         if not offres:
             return 0
 
-        try:
-            # Conversion en dicts
-            offres_dicts = [offre.dict() for offre in offres]
+        # Lots envoyés en parallèle sur le pool de connexions Motor, convertis
+        # en dicts au dernier moment pour ne pas matérialiser tout le lot d'offres
+        semaphore = asyncio.Semaphore(_LOTS_SIMULTANES)
+        resultats = await asyncio.gather(
+            *(
+                self._inserer_lot(offres[i : i + _TAILLE_LOT_INSERTION], semaphore)
+                for i in range(0, len(offres), _TAILLE_LOT_INSERTION)
+            ),
+            return_exceptions=True,
+        )
 
-            result = await self.collection.insert_many(
-                offres_dicts,
-                ordered=False,  # Continue même si certaines sont dupliquées
-            )
-            return len(result.inserted_ids)
+        nb_inserees = 0
+        for resultat in resultats:
+            if isinstance(resultat, asyncio.CancelledError):
+                raise resultat
+            if isinstance(resultat, BaseException):
+                print(f"❌ Erreur insertion batch: {resultat}")
+            else:
+                nb_inserees += resultat
+        return nb_inserees
+
+    async def _inserer_lot(
+        self, lot: list[OffreEmploiModel], semaphore: asyncio.Semaphore
+    ) -> int:
+        """
+        Convertit et insère un lot d'offres
 
-        except Exception as e:
-            print(f"❌ Erreur insertion batch: {e}")
-            return 0
+        Args:
+            lot: Offres du lot
+            semaphore: Limite du nombre de lots en cours
+
+        Returns:
+            Nombre d'offres insérées pour ce lot
+        """
+        async with semaphore:
+            documents = [offre.model_dump() for offre in lot]
+            try:
+                result = await self.collection.insert_many(
+                    documents,
+                    ordered=False,  # Continue même si certaines sont dupliquées
+                )
+                return len(result.inserted_ids)
+            except BulkWriteError as e:
+                # Lot non ordonné : les offres valides sont insérées malgré
+                # les rejets. Seuls les doublons de source_id (code 11000) sont
+                # attendus en ré-exécution ; les autres rejets sont des erreurs
+                details = e.details
+                doublons = 0
+                for erreur in details["writeErrors"]:
+                    if erreur.get("code") == _CODE_CLE_DUPLIQUEE:
+                        doublons += 1
+                    else:
+                        print(
+                            f"❌ Erreur insertion batch: {erreur.get('errmsg', erreur)}"
+                        )
+                if doublons:
+                    print(f"⚠️ {doublons} offres déjà existantes ignorées")
+                return details["nInserted"]
 
     async def get_offre_by_source_id(self, source_id: str) -> dict[str, Any] | None:
         """
@@ -201,23 +283,6 @@ class OffresRepository:
         Returns:
             Statistiques temporelles
         """
-        # Format de groupe selon la granularité
-        group_formats = {
-            "day": {
-                "year": {"$year": "$date_creation"},
-                "month": {"$month": "$date_creation"},
-                "day": {"$dayOfMonth": "$date_creation"},
-            },
-            "week": {
-                "year": {"$year": "$date_creation"},
-                "week": {"$week": "$date_creation"},
-            },
-            "month": {
-                "year": {"$year": "$date_creation"},
-                "month": {"$month": "$date_creation"},
-            },
-        }
-
         match_stage = {}
         if competence:
             match_stage["competences_extraites"] = competence.lower()
@@ -226,7 +291,7 @@ class OffresRepository:
             {"$match": match_stage},
             {
                 "$group": {
-                    "_id": group_formats.get(groupby, group_formats["month"]),
+                    "_id": _GROUP_FORMATS.get(groupby, _GROUP_FORMATS["month"]),
                     "nb_offres": {"$sum": 1},
                     "offres_ids": {"$push": "$source_id"},
                 }
@@ -263,29 +328,17 @@ class OffresRepository:
         Returns:
             Statistiques diverses de la collection
         """
-        total_count = await self.collection.count_documents({})
-
-        # Dernières offres
-        recent_pipeline = [{"$sort": {"date_creation": DESCENDING}}, {"$limit": 1}]
-        recent_cursor = self.collection.aggregate(recent_pipeline)
-        recent_results = await recent_cursor.to_list(length=1)
-
-        # Répartition par mois
-        monthly_pipeline = [
-            {
-                "$group": {
-                    "_id": {
-                        "year": {"$year": "$date_creation"},
-                        "month": {"$month": "$date_creation"},
-                    },
-                    "count": {"$sum": 1},
-                }
-            },
-            {"$sort": {"_id": DESCENDING}},
-            {"$limit": 12},
-        ]
-        monthly_cursor = self.collection.aggregate(monthly_pipeline)
-        monthly_stats = await monthly_cursor.to_list(length=12)
+        # Les trois lectures sont indépendantes : lancées en parallèle
+        # (compte issu des métadonnées : O(1), suffisant pour des statistiques)
+        total_count, recent_results, monthly_stats = await asyncio.gather(
+            self.collection.estimated_document_count(),
+            # Dernières offres
+            self.collection.aggregate(_PIPELINE_DERNIERE_OFFRE).to_list(length=1),
+            # Répartition par mois
+            self.collection.aggregate(_PIPELINE_REPARTITION_MENSUELLE).to_list(
+                length=12
+            ),
+        )
 
         return {
             "total_offres": total_count,
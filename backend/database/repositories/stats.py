@@ -3,6 +3,7 @@ Repository Stats - Accès aux statistiques et métriques
 Gestion des données agrégées et calculs de tendances
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -37,7 +38,7 @@ class StatsRepository:
             True si sauvegarde réussie
         """
         try:
-            stats_dict = stats.dict()
+            stats_dict = stats.model_dump()
 
             # Upsert basé sur la période
             await self.collection_stats.replace_one(
@@ -56,11 +57,10 @@ class StatsRepository:
         Returns:
             Document des dernières statistiques
         """
-        cursor = (
-            self.collection_stats.find({}).sort("date_analyse", DESCENDING).limit(1)
+        # find_one trié : servi par idx_date_analyse, sans curseur ni liste
+        return await self.collection_stats.find_one(
+            {}, sort=[("date_analyse", DESCENDING)]
         )
-        results = await cursor.to_list(length=1)
-        return results[0] if results else None
 
     async def get_stats_by_periode(self, periode: str) -> dict[str, Any] | None:
         """
@@ -87,8 +87,18 @@ class StatsRepository:
         Returns:
             Liste des points d'évolution
         """
+        # $elemMatch côté serveur : seule l'entrée de la compétence est renvoyée,
+        # pas le tableau complet des statistiques de chaque période
         cursor = (
-            self.collection_stats.find({"competences_stats.competence": competence})
+            self.collection_stats.find(
+                {"competences_stats.competence": competence},
+                projection={
+                    "_id": 0,
+                    "periode_analysee": 1,
+                    "date_analyse": 1,
+                    "competences_stats": {"$elemMatch": {"competence": competence}},
+                },
+            )
             .sort("date_analyse", DESCENDING)
             .limit(nb_periodes)
         )
@@ -126,25 +136,27 @@ class StatsRepository:
 
         # Pipeline d'agrégation pour stats temps réel
         pipeline = [
-            {"$match": {"date_creation": {"$gte": date_limite}}},
-            {"$unwind": "$competences_extraites"},
             {
-                "$group": {
-                    "_id": "$competences_extraites",
-                    "nb_offres": {"$sum": 1},
-                    "offres_recentes": {"$addToSet": "$source_id"},
+                "$match": {
+                    "date_creation": {"$gte": date_limite},
+                    "competences_extraites": {"$exists": True, "$ne": []},
                 }
             },
+            {"$project": {"_id": 0, "competences_extraites": 1}},
+            {"$unwind": "$competences_extraites"},
+            {"$group": {"_id": "$competences_extraites", "nb_offres": {"$sum": 1}}},
             {"$sort": {"nb_offres": DESCENDING}},
             {"$limit": 50},
         ]
 
-        cursor = self.collection_offres.aggregate(pipeline)
-        competences_stats = await cursor.to_list(length=50)
-
-        # Stats globales
-        total_offres = await self.collection_offres.count_documents(
-            {"date_creation": {"$gte": date_limite}}
+        # Agrégation et stats globales indépendantes : lancées en parallèle
+        competences_stats, total_offres = await asyncio.gather(
+            self.collection_offres.aggregate(pipeline, allowDiskUse=True).to_list(
+                length=50
+            ),
+            self.collection_offres.count_documents(
+                {"date_creation": {"$gte": date_limite}}
+            ),
         )
 
         # Transformation en format standard
@@ -248,6 +260,7 @@ class StatsRepository:
         if competence:
             match_stage["competences_extraites"] = competence.lower()
 
+        # Seul le comptage par zone est exploité : pas d'accumulateur de tableaux
         pipeline = [
             {"$match": match_stage},
             {
@@ -257,7 +270,6 @@ class StatsRepository:
                         "region": "$localisation.region",
                     },
                     "nb_offres": {"$sum": 1},
-                    "competences_top": {"$addToSet": "$competences_extraites"},
                 }
             },
             {"$sort": {"nb_offres": DESCENDING}},
@@ -296,9 +308,9 @@ class StatsRepository:
         Returns:
             Nombre de documents supprimés
         """
-        # Récupérer les périodes à garder
+        # Récupérer les périodes à garder (seule la date est utile)
         cursor = (
-            self.collection_stats.find({})
+            self.collection_stats.find({}, projection={"_id": 0, "date_analyse": 1})
             .sort("date_analyse", DESCENDING)
             .limit(nb_periodes_a_garder)
         )
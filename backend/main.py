@@ -21,12 +21,17 @@ from backend.pipelines.france_travail_m1805 import (
     run_pipeline_avec_limite,
     PipelineM1805,
 )
-from backend.tools.logging_config import configure_logging, get_logger
+from backend.tools.logging_config import (
+    bind_run_context,
+    configure_logging,
+    get_logger,
+)
 
 
 def afficher_statistiques():
     """Affiche les statistiques du pipeline avec logging structuré"""
     configure_logging()
+    bind_run_context(pipeline="france_travail_m1805", mode="stats")
     logger = get_logger(__name__)
     
     logger.info("Récupération des statistiques du pipeline", 
@@ -44,13 +49,19 @@ def afficher_statistiques():
             "component": "stats"
         })
         
-        # Affichage formaté pour l'utilisateur
-        print("📊 STATISTIQUES PIPELINE M1805")
-        print("=" * 50)
-        print(f"Code ROME: {stats['code_rome']}")
-        print(f"Catégories de compétences: {stats['nb_categories_competences']}")
-        print(f"Compétences totales: {stats['nb_competences_total']}")
-        print(f"Stockage: {stats['stockage']}")
+        # Affichage formaté pour l'utilisateur (une seule écriture sur stdout)
+        print(
+            "\n".join(
+                [
+                    "📊 STATISTIQUES PIPELINE M1805",
+                    "=" * 50,
+                    f"Code ROME: {stats['code_rome']}",
+                    f"Catégories de compétences: {stats['nb_categories_competences']}",
+                    f"Compétences totales: {stats['nb_competences_total']}",
+                    f"Stockage: {stats['stockage']}",
+                ]
+            )
+        )
         
     except Exception as e:
         logger.error("Erreur lors de la récupération des statistiques", 
@@ -62,10 +73,11 @@ def afficher_statistiques():
 def main_avec_limite(limite: int):
     """Exécute le pipeline avec une limite d'offres"""
     configure_logging()
+    bind_run_context(pipeline="france_travail_m1805", mode="limit")
     logger = get_logger(__name__)
     
     logger.warning("Exécution du pipeline avec limite", 
-                  extra={"limite": limite, "component": "main", "mode": "limit"})
+                  extra={"limite": limite, "component": "main"})
 
     try:
         resultat = run_pipeline_avec_limite(limite)
@@ -73,8 +85,6 @@ def main_avec_limite(limite: int):
         if resultat["success"]:
             logger.success("Pipeline avec limite exécuté avec succès", 
                           extra={
-                              "pipeline": "france_travail_m1805",
-                              "mode": "limit",
                               "limite": limite,
                               "status": "success",
                               "nb_offres": resultat['nb_offres']
@@ -84,8 +94,6 @@ def main_avec_limite(limite: int):
         else:
             logger.error("Erreur lors de l'exécution du pipeline avec limite", 
                         extra={
-                            "pipeline": "france_travail_m1805",
-                            "mode": "limit",
                             "limite": limite,
                             "status": "failed",
                             "error": resultat['error']
@@ -93,18 +101,19 @@ def main_avec_limite(limite: int):
 
     except Exception as e:
         logger.critical("Erreur fatale lors de l'exécution avec limite", 
-                       extra={"error": str(e), "mode": "limit", "limite": limite, "component": "main"},
+                       extra={"error": str(e), "limite": limite, "component": "main"},
                        exc_info=True)
 
 
 def main_force():
     """Point d'entrée pour forcer l'exécution (ignore la vérification 24h)"""
     configure_logging()
+    bind_run_context(pipeline="france_travail_m1805", mode="force")
     logger = get_logger(__name__)
 
     logger.warning(
         "Démarrage forcé du pipeline (ignore la vérification 24h)",
-        extra={"mode": "force", "component": "main"},
+        extra={"component": "main"},
     )
 
     try:
@@ -115,8 +124,6 @@ def main_force():
             logger.success(
                 "Pipeline forcé exécuté avec succès",
                 extra={
-                    "pipeline": "france_travail_m1805",
-                    "mode": "force",
                     "status": "success",
                     "nb_offres": resultat["nb_offres"],
                 },
@@ -133,8 +140,6 @@ def main_force():
             logger.error(
                 "Erreur lors de l'exécution du pipeline",
                 extra={
-                    "pipeline": "france_travail_m1805",
-                    "mode": "force",
                     "status": "failed",
                     "error": resultat["error"],
                 },
@@ -143,7 +148,7 @@ def main_force():
     except Exception as e:
         logger.critical(
             "Erreur fatale lors de l'exécution",
-            extra={"error": str(e), "mode": "force", "component": "main"},
+            extra={"error": str(e), "component": "main"},
             exc_info=True,
         )
 
@@ -151,10 +156,11 @@ def main_force():
 def main():
     """Point d'entrée principal - Lance le pipeline complet"""
     configure_logging()
+    bind_run_context(pipeline="france_travail_m1805", mode="normal")
     logger = get_logger(__name__)
 
     logger.info(
-        "Démarrage du pipeline DatavizFT", extra={"mode": "normal", "component": "main"}
+        "Démarrage du pipeline DatavizFT", extra={"component": "main"}
     )
 
     try:
@@ -163,38 +169,29 @@ def main():
 
         if resultat["success"]:
             if resultat.get("skipped"):
+                nb_offres = resultat.get("nb_offres", "N/A")
                 logger.info(
                     "Pipeline ignoré - exécution récente détectée",
                     extra={
-                        "pipeline": "france_travail_m1805",
-                        "mode": "normal",
                         "status": "skipped",
-                        "nb_offres": resultat.get("nb_offres", "N/A"),
+                        "nb_offres": nb_offres,
                     },
                 )
                 logger.info(
-                    f"Dernière collecte: {resultat.get('nb_offres', 'N/A')} offres",
-                    extra={
-                        "component": "cache_check",
-                        "count": resultat.get("nb_offres", "N/A"),
-                    },
+                    f"Dernière collecte: {nb_offres} offres",
+                    extra={"component": "cache_check", "count": nb_offres},
                 )
-                if resultat.get("dernier_fichier"):
-                    import os
-
+                dernier_fichier = resultat.get("dernier_fichier")
+                if dernier_fichier:
+                    nom_fichier = os.path.basename(dernier_fichier)
                     logger.info(
-                        f"Fichier existant: {os.path.basename(resultat['dernier_fichier'])}",
-                        extra={
-                            "component": "file_check",
-                            "filename": os.path.basename(resultat["dernier_fichier"]),
-                        },
+                        f"Fichier existant: {nom_fichier}",
+                        extra={"component": "file_check", "filename": nom_fichier},
                     )
             else:
                 logger.success(
                     "Pipeline exécuté avec succès",
                     extra={
-                        "pipeline": "france_travail_m1805",
-                        "mode": "normal",
                         "status": "success",
                         "nb_offres": resultat["nb_offres"],
                     },
@@ -214,8 +211,6 @@ def main():
             logger.error(
                 "Erreur lors de l'exécution du pipeline",
                 extra={
-                    "pipeline": "france_travail_m1805",
-                    "mode": "normal",
                     "status": "failed",
                     "error": resultat["error"],
                 },
@@ -224,7 +219,7 @@ def main():
     except Exception as e:
         logger.critical(
             "Erreur fatale lors de l'exécution",
-            extra={"error": str(e), "mode": "normal", "component": "main"},
+            extra={"error": str(e), "component": "main"},
             exc_info=True,
         )
 
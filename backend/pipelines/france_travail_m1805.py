@@ -5,15 +5,19 @@ Collecte et analyse des offres d'emploi pour le code ROME M1805 (Études et dév
 
 import glob
 import os
+import re
 from datetime import datetime, timedelta
 from typing import Any
 
 from ..clients.france_travail import FranceTravailAPIClient
-from ..data import COMPETENCES_REFERENTIEL
+from ..data import COMPETENCES_REFERENTIEL, NB_CATEGORIES, NB_COMPETENCES_TOTAL
 from ..tools.competence_analyzer import CompetenceAnalyzer
 from ..tools.data_loader import charger_config_pipeline
 from ..tools.file_manager import FileManager
 
+# Horodatage des fichiers d'offres (ex: offres_M1805_FRANCE_20251005_091707.json)
+_RE_FICHIER_OFFRES = re.compile(r"offres_M1805_FRANCE_(\d{8})_(\d{6})")
+
 
 class PipelineM1805:
     """Pipeline de collecte et d'analyse pour les offres M1805"""
@@ -66,15 +70,19 @@ class PipelineM1805:
 
             # Extraire le timestamp du nom de fichier (format: YYYYMMDD_HHMMSS)
             nom_fichier = os.path.basename(dernier_fichier)
-            # Format: offres_M1805_FRANCE_20251005_091707.json
-            parties = nom_fichier.split("_")
-            if len(parties) >= 4:
-                date_str = parties[3]  # 20251005
-                heure_str = parties[4].split(".")[0]  # 091707
-
-                # Convertir en datetime
-                timestamp_str = f"{date_str}_{heure_str}"
-                derniere_execution = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
+            correspondance = _RE_FICHIER_OFFRES.match(nom_fichier)
+            if correspondance:
+                date_str, heure_str = correspondance.groups()
+
+                # Construction directe du datetime (évite le parsing de strptime)
+                derniere_execution = datetime(
+                    int(date_str[0:4]),
+                    int(date_str[4:6]),
+                    int(date_str[6:8]),
+                    int(heure_str[0:2]),
+                    int(heure_str[2:4]),
+                    int(heure_str[4:6]),
+                )
 
                 # Vérifier si c'est dans les 24 dernières heures
                 maintenant = datetime.now()
@@ -124,9 +132,11 @@ class PipelineM1805:
         print(f"\n[COLLECT] COLLECTE DES OFFRES {self.code_rome}")
         print("=" * 50)
 
-        offres = self.api_client.collecter_offres_par_code_rome(
-            self.code_rome, max_offres=max_offres
-        )
+        # Une seule session HTTP pour toutes les pages, fermée en fin de collecte
+        with self.api_client:
+            offres = self.api_client.collecter_offres_par_code_rome(
+                self.code_rome, max_offres=max_offres
+            )
 
         print(f"[OK] {len(offres)} offres collectees")
         return offres
@@ -257,10 +267,9 @@ class PipelineM1805:
         return {
             "config": self.config,
             "code_rome": self.code_rome,
-            "nb_categories_competences": len(self.competences_referentiel),
-            "nb_competences_total": sum(
-                len(comp) for comp in self.competences_referentiel.values()
-            ),
+            # Comptes calculés une fois au chargement du référentiel
+            "nb_categories_competences": NB_CATEGORIES,
+            "nb_competences_total": NB_COMPETENCES_TOTAL,
             "stockage": stats_stockage,
         }
 
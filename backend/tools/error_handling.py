@@ -2,11 +2,13 @@
 Gestionnaire d'erreurs centralisé pour DatavizFT
 """
 
+import secrets
+import time
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ErrorCategory(str, Enum):
@@ -37,7 +39,7 @@ class DatavizError(BaseModel):
     severity: ErrorSeverity
     message: str
     details: dict[str, Any] | None = None
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     user_message: str | None = None  # Message safe pour l'utilisateur
 
     class Config:
@@ -47,6 +49,17 @@ class DatavizError(BaseModel):
 class DatavizFTException(Exception):
     """Exception de base pour DatavizFT"""
 
+    # Attributs en slots : pas de __dict__ alloué par instance
+    __slots__ = (
+        "message",
+        "category",
+        "severity",
+        "details",
+        "user_message",
+        "_ts_ns",
+        "_error",
+    )
+
     def __init__(
         self,
         message: str,
@@ -56,26 +69,63 @@ class DatavizFTException(Exception):
         user_message: str | None = None,
     ):
         super().__init__(message)
-        self.error = DatavizError(
-            error_id=self._generate_error_id(),
-            category=category,
-            severity=severity,
-            message=message,
-            details=details or {},
-            user_message=user_message or "Une erreur est survenue",
+        self.message = message
+        self.category = category
+        self.severity = severity
+        self.details = details
+        self.user_message = user_message
+        # Horodatage brut : le datetime n'est construit que si l'erreur est exploitée
+        self._ts_ns = time.time_ns()
+        self._error: DatavizError | None = None
+
+    def __reduce__(self):
+        """
+        Sérialisation pickle/copy conservant l'état en slots
+
+        BaseException.__reduce__ ne transmet que args et __dict__ : sans ce
+        retour explicite, l'exception serait reconstruite via __init__ et
+        perdrait ses attributs (message préfixé deux fois, détails vides).
+        """
+        return (
+            type(self).__new__,
+            (type(self), *self.args),
+            {name: getattr(self, name) for name in DatavizFTException.__slots__},
+        )
+
+    @property
+    def timestamp(self) -> datetime:
+        """Date de création de l'exception"""
+        secondes, nanosecondes = divmod(self._ts_ns, 1_000_000_000)
+        return datetime.fromtimestamp(secondes).replace(
+            microsecond=nanosecondes // 1000
         )
 
+    @property
+    def error(self) -> DatavizError:
+        """Modèle d'erreur standardisé, construit à la première demande"""
+        if self._error is None:
+            self._error = DatavizError(
+                error_id=self._generate_error_id(),
+                category=self.category,
+                severity=self.severity,
+                message=self.message,
+                details=self.details or {},
+                timestamp=self.timestamp,
+                user_message=self.user_message or "Une erreur est survenue",
+            )
+        return self._error
+
     def _generate_error_id(self) -> str:
         """Génère un ID unique pour l'erreur"""
-        from uuid import uuid4
-
-        return f"DVFT-{uuid4().hex[:8].upper()}"
+        return f"DVFT-{secrets.token_hex(4).upper()}"
 
 
 # Exceptions spécialisées
 class FranceTravailAPIError(DatavizFTException):
     """Erreur API France Travail"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, status_code: int | None = None):
         super().__init__(
             message=f"Erreur API France Travail: {message}",
@@ -89,6 +139,8 @@ class FranceTravailAPIError(DatavizFTException):
 class CompetenceAnalysisError(DatavizFTException):
     """Erreur lors de l'analyse des compétences"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, offre_id: str | None = None):
         super().__init__(
             message=f"Erreur analyse compétences: {message}",
@@ -102,6 +154,8 @@ class CompetenceAnalysisError(DatavizFTException):
 class DatabaseConnectionError(DatavizFTException):
     """Erreur de connexion base de données"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, db_type: str = "MongoDB"):
         super().__init__(
             message=f"Erreur connexion {db_type}: {message}",
@@ -112,6 +166,12 @@ class DatabaseConnectionError(DatavizFTException):
         )
 
 
+# Sévérités déclenchant une notification (ensemble construit une seule fois)
+_SEVERITES_NOTIFIEES: frozenset[ErrorSeverity] = frozenset(
+    {ErrorSeverity.HIGH, ErrorSeverity.CRITICAL}
+)
+
+
 # Gestionnaire central d'erreurs
 class ErrorManager:
     """Gestionnaire centralisé des erreurs"""
@@ -146,7 +206,7 @@ class ErrorManager:
         )
 
         # Notification selon la sévérité
-        if error_obj.severity in [ErrorSeverity.HIGH, ErrorSeverity.CRITICAL]:
+        if error_obj.severity in _SEVERITES_NOTIFIEES:
             ErrorManager._notify_critical_error(error_obj)
 
         return error_obj
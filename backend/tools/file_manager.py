@@ -3,13 +3,18 @@ File Manager - Gestion des fichiers et sauvegarde
 Sauvegarde des offres, résultats d'analyse et gestion des dossiers
 """
 
-import json
+import heapq
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .text_processor import nettoyer_offres_pour_json
 
+# Même rendu que json.dump(indent=2, ensure_ascii=False), sérialisé en octets
+_OPTIONS_JSON = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 
 class FileManager:
     """Gestionnaire de fichiers pour les données du projet"""
@@ -49,7 +54,8 @@ class FileManager:
         Returns:
             Chemin du fichier sauvegardé
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        maintenant = datetime.now()
+        timestamp = maintenant.strftime("%Y%m%d_%H%M%S")
         nom_fichier = f"offres_{code_rome}_FRANCE_{timestamp}.json"
         chemin_fichier = self.data_dir / nom_fichier
 
@@ -60,7 +66,7 @@ class FileManager:
         # Préparation des métadonnées
         donnees_complete = {
             "metadata": {
-                "date_collecte": datetime.now().isoformat(),
+                "date_collecte": maintenant.isoformat(),
                 "nb_offres": len(offres_nettoyees),
                 "code_rome": code_rome,
                 "source": "France Travail API v2",
@@ -70,15 +76,8 @@ class FileManager:
         }
 
         try:
-            with open(chemin_fichier, "w", encoding="utf-8", newline="\n") as f:
-                json.dump(
-                    donnees_complete,
-                    f,
-                    ensure_ascii=False,
-                    indent=2,
-                    sort_keys=False,
-                    separators=(",", ": "),
-                )
+            with open(chemin_fichier, "wb") as f:
+                f.write(orjson.dumps(donnees_complete, option=_OPTIONS_JSON))
 
             print(f"💾 Offres sauvegardées: {chemin_fichier}")
             print(
@@ -105,14 +104,15 @@ class FileManager:
         Returns:
             Chemin du fichier sauvegardé
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        maintenant = datetime.now()
+        timestamp = maintenant.strftime("%Y%m%d_%H%M%S")
         nom_fichier = f"analyse_competences_{code_rome}_{timestamp}.json"
         chemin_fichier = self.results_dir / nom_fichier
 
         # Préparation des métadonnées
         donnees_complete = {
             "metadata": {
-                "date_analyse": datetime.now().isoformat(),
+                "date_analyse": maintenant.isoformat(),
                 "code_rome": code_rome,
                 "nb_offres_analysees": resultats.get("nb_offres_analysees", 0),
                 "version_analyzer": "DatavizFT v1.0",
@@ -121,8 +121,8 @@ class FileManager:
         }
 
         try:
-            with open(chemin_fichier, "w", encoding="utf-8") as f:
-                json.dump(donnees_complete, f, ensure_ascii=False, indent=2)
+            with open(chemin_fichier, "wb") as f:
+                f.write(orjson.dumps(donnees_complete, option=_OPTIONS_JSON))
 
             print(f"📊 Analyse sauvegardée: {chemin_fichier}")
             return str(chemin_fichier)
@@ -148,7 +148,8 @@ class FileManager:
         Returns:
             Chemin du fichier sauvegardé
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        maintenant = datetime.now()
+        timestamp = maintenant.strftime("%Y%m%d_%H%M%S")
         nom_fichier = f"competences_extraites_{timestamp}.json"
         chemin_fichier = self.data_dir / nom_fichier
 
@@ -157,18 +158,22 @@ class FileManager:
             len(cat["competences"]) for cat in resultats_par_categorie.values()
         )
 
-        # Création du top global
-        top_competences = []
-        for categorie, resultats in resultats_par_categorie.items():
-            for comp in resultats["competences"]:
-                top_competences.append({**comp, "categorie": categorie})
-
-        top_competences.sort(key=lambda x: x["occurrences"], reverse=True)
+        # Création du top global : sélection partielle (heap de 10) plutôt
+        # qu'un tri complet de toutes les compétences détectées
+        top_competences = heapq.nlargest(
+            10,
+            (
+                {**comp, "categorie": categorie}
+                for categorie, resultats in resultats_par_categorie.items()
+                for comp in resultats["competences"]
+            ),
+            key=lambda x: x["occurrences"],
+        )
 
         # Structure enrichie
         competences_enrichies = {
             "metadata": {
-                "date_extraction": datetime.now().isoformat(),
+                "date_extraction": maintenant.isoformat(),
                 "code_rome": code_rome,
                 "nb_offres_analysees": nb_offres_total,
                 "nb_competences_detectees": total_competences_detectees,
@@ -176,7 +181,7 @@ class FileManager:
                 "version": "DatavizFT v1.0",
             },
             "resume_global": {
-                "top_10_competences": top_competences[:10],
+                "top_10_competences": top_competences,
                 "repartition_par_categorie": {
                     cat: len(res["competences"])
                     for cat, res in resultats_par_categorie.items()
@@ -186,8 +191,8 @@ class FileManager:
         }
 
         try:
-            with open(chemin_fichier, "w", encoding="utf-8") as f:
-                json.dump(competences_enrichies, f, ensure_ascii=False, indent=2)
+            with open(chemin_fichier, "wb") as f:
+                f.write(orjson.dumps(competences_enrichies, option=_OPTIONS_JSON))
 
             print(f"🎯 Compétences enrichies sauvegardées: {chemin_fichier}")
             print(f"📈 {total_competences_detectees} compétences détectées")
@@ -209,8 +214,9 @@ class FileManager:
             Liste des offres chargées
         """
         try:
-            with open(chemin_fichier, encoding="utf-8") as f:
-                data = json.load(f)
+            # orjson parse directement les octets (pas de décodage texte préalable)
+            with open(chemin_fichier, "rb") as f:
+                data = orjson.loads(f.read())
 
             # Support des deux formats (avec/sans métadonnées)
             if isinstance(data, list):
@@ -2,16 +2,113 @@
 Configuration logging professionnelle pour DatavizFT
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
+import queue
+import re
+import secrets
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Any
 
 import structlog
 from pythonjsonlogger import jsonlogger
 
+# Listener qui écrit les logs fichiers depuis un thread dédié
+_file_listener: logging.handlers.QueueListener | None = None
+
+# Niveaux acceptés par configure_logging / setup_file_logging
+_LEVELS: dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Couples (app_name, dossier) déjà branchés : évite les handlers en double
+_INSTALLED: set[tuple[str, str]] = set()
+
+# Codes de couleurs ANSI (compilé une seule fois)
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+# Chaîne de processeurs structlog, construite une seule fois
+# Production : minimum de callables par enregistrement, sortie JSON
+_PROD_PROCESSORS: list[Any] = [
+    structlog.stdlib.filter_by_level,
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.processors.TimeStamper(fmt="ISO"),
+    structlog.processors.format_exc_info,  # Conserve les tracebacks en JSON
+    structlog.processors.JSONRenderer(),
+]
+
+# Développement : chaîne complète avec rendu console coloré
+_DEV_PROCESSORS: list[Any] = [
+    structlog.stdlib.filter_by_level,
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="ISO"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+    structlog.dev.ConsoleRenderer(colors=True),
+]
+
+
+class CleanFormatter(logging.Formatter):
+    """Formatter qui supprime les codes de couleurs ANSI"""
+
+    def format(self, record):
+        # Supprimer les codes ANSI des messages (test rapide avant la regex)
+        message = str(record.msg)
+        if "\x1b" in message:
+            record.msg = _ANSI_ESCAPE.sub("", message)
+        formatted = super().format(record)
+        if "\x1b" not in formatted:
+            return formatted
+        return _ANSI_ESCAPE.sub("", formatted)
+
+
+# Formatters sans état, partagés par tous les handlers fichiers
+# Format simple pour les logs généraux
+_SIMPLE_FORMATTER = CleanFormatter(
+    "%(asctime)s [%(levelname)s] %(name)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# Format JSON pour les erreurs
+_JSON_FORMATTER = jsonlogger.JsonFormatter(
+    "%(asctime)s %(name)s %(levelname)s %(message)s"
+)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler pour file en mémoire, qui conserve exc_info"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Copie l'enregistrement sans le pré-formater
+
+        Le prepare() standard fusionne le traceback dans msg et vide exc_info
+        (nécessaire seulement pour une file picklée) : les handlers fichiers
+        ne pourraient plus émettre le champ "exc_info" séparé en JSON.
+        """
+        return copy.copy(record)
+
+
+def _parse_level(log_level: str) -> int:
+    """Convertit un nom de niveau ("info", "DEBUG"...) en niveau logging"""
+    try:
+        return _LEVELS[log_level.upper()]
+    except KeyError:
+        raise ValueError(f"Niveau de log invalide: {log_level}") from None
+
 
 def configure_logging(
     app_name: str = "dataviz-ft",
@@ -22,21 +119,9 @@ def configure_logging(
 
     # Configuration structlog
     structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="ISO"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            (
-                structlog.processors.JSONRenderer()
-                if environment == "production"
-                else structlog.dev.ConsoleRenderer(colors=True)
-            ),
-        ],
+        processors=(
+            _PROD_PROCESSORS if environment == "production" else _DEV_PROCESSORS
+        ),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -47,7 +132,7 @@ def configure_logging(
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        level=_parse_level(log_level),
     )
 
     # Logger pour les fichiers (toujours actif)
@@ -56,8 +141,14 @@ def configure_logging(
 
 def setup_file_logging(app_name: str, log_level: str) -> None:
     """Configure le logging vers fichier avec rotation"""
+    global _file_listener
 
     log_dir = Path("logs")
+    key = (app_name, str(log_dir.resolve()))
+    if key in _INSTALLED:
+        return
+    _INSTALLED.add(key)
+
     log_dir.mkdir(exist_ok=True)
 
     # Handler pour les logs généraux avec rotation (5MB max, 5 fichiers)
@@ -67,7 +158,7 @@ def setup_file_logging(app_name: str, log_level: str) -> None:
         backupCount=5,
         encoding="utf-8",
     )
-    file_handler.setLevel(getattr(logging, log_level.upper()))
+    file_handler.setLevel(_parse_level(log_level))
 
     # Handler pour les erreurs avec rotation
     error_handler = logging.handlers.RotatingFileHandler(
@@ -78,37 +169,24 @@ def setup_file_logging(app_name: str, log_level: str) -> None:
     )
     error_handler.setLevel(logging.ERROR)
 
-    # Formatter simple qui nettoie les codes ANSI
-    class CleanFormatter(logging.Formatter):
-        """Formatter qui supprime les codes de couleurs ANSI"""
-
-        def format(self, record):
-            # Supprimer les codes ANSI des messages
-            import re
+    file_handler.setFormatter(_SIMPLE_FORMATTER)
+    error_handler.setFormatter(_JSON_FORMATTER)
 
-            ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-            if hasattr(record, "msg"):
-                record.msg = ansi_escape.sub("", str(record.msg))
-            formatted = super().format(record)
-            return ansi_escape.sub("", formatted)
+    # Écritures disque déportées sur un thread : l'appelant ne fait qu'enfiler
+    # l'enregistrement, le QueueListener le transmet aux handlers fichiers
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = _LocalQueueHandler(log_queue)
+    queue_handler.setLevel(file_handler.level)
 
-    # Format simple pour les logs généraux
-    simple_formatter = CleanFormatter(
-        "%(asctime)s [%(levelname)s] %(name)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+    _file_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, error_handler, respect_handler_level=True
     )
-
-    # Format JSON pour les erreurs
-    json_formatter = jsonlogger.JsonFormatter(
-        "%(asctime)s %(name)s %(levelname)s %(message)s"
-    )
-
-    file_handler.setFormatter(simple_formatter)
-    error_handler.setFormatter(json_formatter)
+    _file_listener.start()
+    atexit.register(_file_listener.stop)  # Vide la file avant la sortie
 
     # Ajout aux loggers
     root_logger = logging.getLogger()
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(error_handler)
+    root_logger.addHandler(queue_handler)
 
 
 class ExtendedLogger:
@@ -126,6 +204,22 @@ class ExtendedLogger:
         self._logger.info(f"✅ {message}", **kwargs)
 
 
+def bind_run_context(**context: Any) -> str:
+    """
+    Associe un correlation_id (et un contexte optionnel) à tous les logs du run
+
+    Args:
+        **context: Champs supplémentaires ajoutés à chaque log (ex: mode)
+
+    Returns:
+        Le correlation_id généré
+    """
+    correlation_id = secrets.token_hex(6)
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(correlation_id=correlation_id, **context)
+    return correlation_id
+
+
 def get_logger(name: str) -> ExtendedLogger:
     """Récupère un logger structuré étendu"""
     base_logger = structlog.get_logger(name)
@@ -139,15 +233,15 @@ class LogExecutionTime:
     def __init__(self, logger: Any, operation: str):
         self.logger = logger
         self.operation = operation
-        self.start_time = None
+        self.start_time: int | None = None  # perf_counter_ns au démarrage
 
     def __enter__(self):
-        self.start_time = datetime.now()
+        self.start_time = time.perf_counter_ns()
         self.logger.info("Operation started", operation=self.operation)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.now() - self.start_time).total_seconds()
+        duration = (time.perf_counter_ns() - self.start_time) / 1e9
         if exc_type:
             self.logger.error(
                 "Operation failed",
@@ -0,0 +1,155 @@
+"""Tests pour le client API France Travail."""
+
+from unittest.mock import Mock, patch
+
+import httpx
+import orjson
+import pytest
+
+from backend.clients.france_travail import FranceTravailAPIClient
+
+
+def _reponse_page(offres: list, total: int, status_code: int = 206) -> Mock:
+    """Construit une réponse httpx simulée pour une page de résultats."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {"Content-Range": f"offres 0-{len(offres) - 1}/{total}"}
+    response.content = orjson.dumps({"resultats": offres})
+    return response
+
+
+@pytest.fixture
+def client() -> FranceTravailAPIClient:
+    """Client avec headers pré-remplis (pas d'appel OAuth)."""
+    api_client = FranceTravailAPIClient(rate_limit_ms=120)
+    api_client._headers = {"Authorization": "Bearer test"}
+    return api_client
+
+
+class TestCollecterOffresPaginees:
+    """Tests de la collecte paginée."""
+
+    def test_collecte_toutes_les_pages(self, client: FranceTravailAPIClient) -> None:
+        """Test que toutes les pages sont agrégées, sans appel dédié au total."""
+        pages = [
+            _reponse_page([{"id": "1"}, {"id": "2"}], total=3),
+            _reponse_page([{"id": "3"}], total=3),
+        ]
+
+        with (
+            patch.object(httpx.Client, "get", side_effect=pages) as mock_get,
+            patch("backend.clients.france_travail.time.sleep"),
+        ):
+            offres = client.collecter_offres_paginees(
+                {"codeROME": "M1805"}, page_size=2
+            )
+
+        assert [o["id"] for o in offres] == ["1", "2", "3"]
+        ranges = [c.kwargs["params"]["range"] for c in mock_get.call_args_list]
+        assert ranges == ["0-1", "2-2"]
+
+    def test_limite_max_offres(self, client: FranceTravailAPIClient) -> None:
+        """Test que la première page respecte max_offres."""
+        pages = [_reponse_page([{"id": "1"}, {"id": "2"}], total=500)]
+
+        with (
+            patch.object(httpx.Client, "get", side_effect=pages) as mock_get,
+            patch("backend.clients.france_travail.time.sleep"),
+        ):
+            offres = client.collecter_offres_paginees(
+                {"codeROME": "M1805"}, max_offres=2
+            )
+
+        assert len(offres) == 2
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["params"]["range"] == "0-1"
+
+    def test_aucune_offre(self, client: FranceTravailAPIClient) -> None:
+        """Test d'une recherche sans résultat (204 No Content)."""
+        response = Mock(status_code=204)
+
+        with patch.object(httpx.Client, "get", return_value=response):
+            assert client.collecter_offres_paginees({"codeROME": "M1805"}) == []
+
+    def test_pas_de_pause_si_requete_lente(
+        self, client: FranceTravailAPIClient
+    ) -> None:
+        """Test qu'aucune pause n'est faite si la requête a dépassé la fenêtre."""
+        pages = [
+            _reponse_page([{"id": "1"}], total=2),
+            _reponse_page([{"id": "2"}], total=2),
+        ]
+        # La première requête dure 0.5s, bien au-delà des 120ms de rate limit
+        horloge = iter([0.0, 0.5, 1.0])
+
+        with (
+            patch.object(httpx.Client, "get", side_effect=pages),
+            patch(
+                "backend.clients.france_travail.time.monotonic",
+                side_effect=lambda: next(horloge),
+            ),
+            patch("backend.clients.france_travail.time.sleep") as mock_sleep,
+        ):
+            client.collecter_offres_paginees({"codeROME": "M1805"}, page_size=1)
+
+        mock_sleep.assert_not_called()
+
+    def test_pause_du_reliquat_si_requete_rapide(
+        self, client: FranceTravailAPIClient
+    ) -> None:
+        """Test que seule la fin de la fenêtre de rate limit est attendue."""
+        pages = [
+            _reponse_page([{"id": "1"}], total=2),
+            _reponse_page([{"id": "2"}], total=2),
+        ]
+        # Première requête en 20ms : il reste 100ms à attendre
+        horloge = iter([0.0, 0.02, 1.0])
+
+        with (
+            patch.object(httpx.Client, "get", side_effect=pages),
+            patch(
+                "backend.clients.france_travail.time.monotonic",
+                side_effect=lambda: next(horloge),
+            ),
+            patch("backend.clients.france_travail.time.sleep") as mock_sleep,
+        ):
+            client.collecter_offres_paginees({"codeROME": "M1805"}, page_size=1)
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.1)
+
+
+class TestSessionHttp:
+    """Tests du client HTTP persistant."""
+
+    def test_session_reutilisee_entre_pages(
+        self, client: FranceTravailAPIClient
+    ) -> None:
+        """Test qu'un seul httpx.Client sert toutes les requêtes."""
+        assert client._get_http() is client._get_http()
+
+    def test_context_manager_ferme_la_session(
+        self, client: FranceTravailAPIClient
+    ) -> None:
+        """Test que la sortie du bloc with ferme le client HTTP."""
+        with client:
+            http = client._get_http()
+
+        assert http.is_closed
+        assert client._http is None
+
+    def test_token_demande_via_session(self) -> None:
+        """Test que la requête OAuth passe par le client HTTP persistant."""
+        api_client = FranceTravailAPIClient()
+        response = Mock(status_code=200)
+        response.content = orjson.dumps({"access_token": "abc"})
+
+        with (
+            patch("backend.clients.france_travail.FRANCETRAVAIL_CLIENT_ID", "id"),
+            patch("backend.clients.france_travail.FRANCETRAVAIL_CLIENT_SECRET", "s"),
+            patch.object(httpx.Client, "post", return_value=response) as mock_post,
+        ):
+            assert api_client._get_token() == "abc"
+
+        mock_post.assert_called_once()
+        api_client.close()
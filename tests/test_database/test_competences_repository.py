@@ -0,0 +1,63 @@
+"""Tests pour le repository des compétences."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from pymongo import UpdateOne
+
+from backend.database.repositories.competences import CompetencesRepository
+
+
+@pytest.fixture
+def repo() -> CompetencesRepository:
+    """Repository branché sur des collections Motor simulées."""
+    database = MagicMock()
+    database.competences.bulk_write = AsyncMock(return_value=Mock(modified_count=2))
+    return CompetencesRepository(database)
+
+
+def _detections(repo: CompetencesRepository, stats: list) -> None:
+    """Simule le résultat de l'agrégation des détections."""
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=stats)
+    repo.collection_detections.aggregate.return_value = cursor
+
+
+class TestSyncCompetencesFromDetections:
+    """Tests de la synchronisation des popularités."""
+
+    def test_un_seul_bulk_write(self, repo: CompetencesRepository) -> None:
+        """Test que toutes les popularités partent dans un seul bulk_write."""
+        _detections(
+            repo,
+            [
+                {"_id": "Python", "nb_detections": 500, "confiance_moyenne": 0.9},
+                {"_id": "Docker", "nb_detections": 4000, "confiance_moyenne": 0.8},
+            ],
+        )
+
+        resultat = asyncio.run(repo.sync_competences_from_detections())
+
+        repo.collection.bulk_write.assert_awaited_once()
+        operations = repo.collection.bulk_write.call_args.args[0]
+        assert operations == [
+            UpdateOne({"nom_normalise": "python"}, {"$set": {"popularite": 0.45}}),
+            UpdateOne({"nom_normalise": "docker"}, {"$set": {"popularite": 1.0}}),
+        ]
+        assert repo.collection.bulk_write.call_args.kwargs["ordered"] is False
+        assert resultat == {
+            "competences_analysees": 2,
+            "competences_mises_a_jour": 2,
+            "top_competence": "Python",
+        }
+
+    def test_aucune_detection(self, repo: CompetencesRepository) -> None:
+        """Test qu'aucune écriture n'est envoyée sans détection."""
+        _detections(repo, [])
+
+        resultat = asyncio.run(repo.sync_competences_from_detections())
+
+        repo.collection.bulk_write.assert_not_called()
+        assert resultat["competences_mises_a_jour"] == 0
+        assert resultat["top_competence"] is None
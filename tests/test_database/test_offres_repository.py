@@ -0,0 +1,127 @@
+"""Tests pour le repository des offres."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from backend.database.repositories import offres as offres_module
+from backend.database.repositories.offres import OffresRepository
+
+
+def _offre(source_id: str) -> Mock:
+    """Offre simulée exposant model_dump() comme un modèle Pydantic."""
+    offre = Mock()
+    offre.model_dump.return_value = {"source_id": source_id}
+    return offre
+
+
+@pytest.fixture
+def repo() -> OffresRepository:
+    """Repository branché sur une collection Motor simulée."""
+    database = MagicMock()
+    database.offres.insert_many = AsyncMock(
+        side_effect=lambda docs, **_: Mock(inserted_ids=list(range(len(docs))))
+    )
+    return OffresRepository(database)
+
+
+class TestInsertManyOffres:
+    """Tests de l'insertion en lot."""
+
+    def test_liste_vide(self, repo: OffresRepository) -> None:
+        """Test qu'aucune requête n'est envoyée sans offre."""
+        assert asyncio.run(repo.insert_many_offres([])) == 0
+        repo.collection.insert_many.assert_not_called()
+
+    def test_insertion_par_lots(self, repo: OffresRepository, monkeypatch) -> None:
+        """Test du découpage en lots non ordonnés et du cumul des insertions."""
+        monkeypatch.setattr(offres_module, "_TAILLE_LOT_INSERTION", 2)
+        offres = [_offre(str(i)) for i in range(5)]
+
+        assert asyncio.run(repo.insert_many_offres(offres)) == 5
+
+        tailles = [len(c.args[0]) for c in repo.collection.insert_many.call_args_list]
+        assert tailles == [2, 2, 1]
+        assert all(
+            c.kwargs["ordered"] is False
+            for c in repo.collection.insert_many.call_args_list
+        )
+
+    def test_lot_en_erreur_ignore(self, repo: OffresRepository, monkeypatch) -> None:
+        """Test qu'un lot en échec n'annule pas le décompte des autres lots."""
+        monkeypatch.setattr(offres_module, "_TAILLE_LOT_INSERTION", 2)
+        repo.collection.insert_many.side_effect = [
+            Mock(inserted_ids=[1, 2]),
+            RuntimeError("connexion perdue"),
+        ]
+
+        offres = [_offre(str(i)) for i in range(4)]
+        assert asyncio.run(repo.insert_many_offres(offres)) == 2
+
+    def test_lots_simultanes_bornes(self, repo: OffresRepository, monkeypatch) -> None:
+        """Test que le nombre de lots convertis et en vol reste borné."""
+        monkeypatch.setattr(offres_module, "_TAILLE_LOT_INSERTION", 1)
+        monkeypatch.setattr(offres_module, "_LOTS_SIMULTANES", 2)
+        en_cours = 0
+        pic = 0
+
+        async def insert_many(docs, ordered):
+            nonlocal en_cours, pic
+            assert ordered is False
+            en_cours += 1
+            pic = max(pic, en_cours)
+            await asyncio.sleep(0)
+            en_cours -= 1
+            return Mock(inserted_ids=docs)
+
+        repo.collection.insert_many.side_effect = insert_many
+
+        offres = [_offre(str(i)) for i in range(6)]
+        assert asyncio.run(repo.insert_many_offres(offres)) == 6
+        assert pic == 2
+
+    def test_doublons_comptes_via_n_inserted(
+        self, repo: OffresRepository, monkeypatch
+    ) -> None:
+        """Test qu'un lot partiellement dupliqué compte ses insertions réelles."""
+        monkeypatch.setattr(offres_module, "_TAILLE_LOT_INSERTION", 3)
+        repo.collection.insert_many.side_effect = [
+            BulkWriteError({"nInserted": 2, "writeErrors": [{"code": 11000}]}),
+            Mock(inserted_ids=[1, 2]),
+        ]
+
+        offres = [_offre(str(i)) for i in range(5)]
+        assert asyncio.run(repo.insert_many_offres(offres)) == 4
+
+    def test_erreurs_hors_doublons_signalees(
+        self, repo: OffresRepository, monkeypatch, capsys
+    ) -> None:
+        """Test qu'un rejet autre qu'un doublon est signalé comme erreur."""
+        monkeypatch.setattr(offres_module, "_TAILLE_LOT_INSERTION", 3)
+        repo.collection.insert_many.side_effect = [
+            BulkWriteError(
+                {
+                    "nInserted": 1,
+                    "writeErrors": [
+                        {"code": 11000, "errmsg": "E11000 duplicate key"},
+                        {"code": 121, "errmsg": "Document failed validation"},
+                    ],
+                }
+            ),
+        ]
+
+        offres = [_offre(str(i)) for i in range(3)]
+        assert asyncio.run(repo.insert_many_offres(offres)) == 1
+
+        sortie = capsys.readouterr().out
+        assert "1 offres déjà existantes ignorées" in sortie
+        assert "❌ Erreur insertion batch: Document failed validation" in sortie
+
+    def test_annulation_propagee(self, repo: OffresRepository) -> None:
+        """Test qu'un lot annulé propage l'annulation au lieu d'être compté."""
+        repo.collection.insert_many.side_effect = asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(repo.insert_many_offres([_offre("1")]))
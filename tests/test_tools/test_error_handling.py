@@ -0,0 +1,81 @@
+"""Tests pour la gestion centralisée des erreurs."""
+
+import copy
+import pickle
+from datetime import datetime
+from unittest.mock import Mock
+
+from backend.tools.error_handling import (
+    DatavizFTException,
+    ErrorCategory,
+    ErrorManager,
+    ErrorSeverity,
+    FranceTravailAPIError,
+)
+
+
+class TestDatavizFTException:
+    """Tests pour DatavizFTException."""
+
+    def test_error_model(self) -> None:
+        """Test du modèle d'erreur exposé par l'exception."""
+        exc = FranceTravailAPIError("timeout", status_code=503)
+
+        assert exc.error.error_id.startswith("DVFT-")
+        assert len(exc.error.error_id) == len("DVFT-") + 8
+        assert exc.error.category == ErrorCategory.EXTERNAL_SERVICE_ERROR
+        assert exc.error.severity == ErrorSeverity.HIGH
+        assert exc.error.details == {"status_code": 503}
+        assert "timeout" in exc.error.message
+
+    def test_error_model_stable(self) -> None:
+        """Test que le modèle (et son ID) est construit une seule fois."""
+        exc = DatavizFTException("boom", category=ErrorCategory.SYSTEM_ERROR)
+        assert exc.error is exc.error
+        assert exc.error.user_message == "Une erreur est survenue"
+        assert exc.error.details == {}
+
+    def test_timestamp_at_creation(self) -> None:
+        """Test que l'horodatage correspond à la création de l'exception."""
+        avant = datetime.now()
+        exc = DatavizFTException("boom", category=ErrorCategory.SYSTEM_ERROR)
+        apres = datetime.now()
+
+        assert avant <= exc.timestamp <= apres
+        assert exc.error.timestamp == exc.timestamp
+
+    def test_attributs_en_slots(self) -> None:
+        """Test que les attributs sont stockés en slots, sans __dict__ rempli."""
+        exc = FranceTravailAPIError("timeout", status_code=503)
+        assert exc.error is not None
+
+        assert exc.__dict__ == {}
+        assert exc.details == {"status_code": 503}
+
+    def test_pickle_conserve_etat(self) -> None:
+        """Test qu'un aller-retour pickle/copy conserve l'état en slots."""
+        exc = FranceTravailAPIError("x", status_code=500)
+        error_id = exc.error.error_id
+
+        for copie in (pickle.loads(pickle.dumps(exc)), copy.copy(exc)):
+            assert type(copie) is FranceTravailAPIError
+            assert copie.message == "Erreur API France Travail: x"
+            assert copie.details == {"status_code": 500}
+            assert copie.error.error_id == error_id
+            assert copie.timestamp == exc.timestamp
+
+
+class TestErrorManager:
+    """Tests pour ErrorManager."""
+
+    def test_handle_dataviz_error(self) -> None:
+        """Test du traitement d'une exception DatavizFT."""
+        exc = DatavizFTException(
+            "boom", category=ErrorCategory.DATABASE_ERROR, severity=ErrorSeverity.LOW
+        )
+        logger = Mock()
+
+        error_obj = ErrorManager.handle_error(exc, logger)
+
+        assert error_obj is exc.error
+        logger.error.assert_called_once()
@@ -179,4 +179,31 @@ class TestFileManager:
         fm.creer_structure_dossiers()
         
         success = fm.supprimer_fichier("missing_file.json")
-        assert success is False
\ No newline at end of file
+        assert success is False
+
+    def test_top_10_competences_enrichies(self, temp_dir: Path) -> None:
+        """Test que le top global garde les 10 meilleures, triées, toutes catégories."""
+        fm = FileManager(temp_dir)
+        fm.creer_structure_dossiers()
+
+        resultats = {
+            "langages": {
+                "competences": [
+                    {"competence": f"lang{i}", "occurrences": i} for i in range(8)
+                ]
+            },
+            "outils": {
+                "competences": [
+                    {"competence": f"outil{i}", "occurrences": i * 3} for i in range(8)
+                ]
+            },
+        }
+
+        chemin = fm.sauvegarder_competences_enrichies(resultats, nb_offres_total=50)
+        with open(chemin, encoding="utf-8") as f:
+            top = json.load(f)["resume_global"]["top_10_competences"]
+
+        occurrences = [c["occurrences"] for c in top]
+        assert len(top) == 10
+        assert occurrences == sorted(occurrences, reverse=True)
+        assert top[0] == {"competence": "outil7", "occurrences": 21, "categorie": "outils"}
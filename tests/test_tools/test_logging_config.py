@@ -0,0 +1,159 @@
+"""Tests pour la configuration du logging."""
+
+import atexit
+import json
+import logging
+import logging.handlers
+from unittest.mock import MagicMock, patch
+
+import pytest
+import structlog
+
+from backend.tools import logging_config
+from backend.tools.logging_config import (
+    CleanFormatter,
+    LogExecutionTime,
+    _parse_level,
+    bind_run_context,
+    setup_file_logging,
+)
+
+
+def _record(msg: str, args: tuple = ()) -> logging.LogRecord:
+    """Construit un LogRecord minimal."""
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+
+
+class TestCleanFormatter:
+    """Tests pour CleanFormatter."""
+
+    def test_supprime_codes_ansi(self) -> None:
+        """Test de suppression des codes couleurs dans le message."""
+        formatter = CleanFormatter("%(message)s")
+        assert formatter.format(_record("\x1b[32mOK\x1b[0m fini")) == "OK fini"
+
+    def test_supprime_codes_ansi_arguments(self) -> None:
+        """Test de suppression des codes couleurs apportés par les arguments."""
+        formatter = CleanFormatter("%(message)s")
+        assert (
+            formatter.format(_record("statut %s", ("\x1b[1mKO\x1b[0m",))) == "statut KO"
+        )
+
+    def test_message_sans_ansi_inchange(self) -> None:
+        """Test qu'un message sans code couleur est conservé tel quel."""
+        formatter = CleanFormatter("[%(levelname)s] %(message)s")
+        assert (
+            formatter.format(_record("Pipeline démarré")) == "[INFO] Pipeline démarré"
+        )
+
+
+class TestParseLevel:
+    """Tests pour _parse_level."""
+
+    def test_niveau_insensible_a_la_casse(self) -> None:
+        """Test de conversion d'un nom de niveau en minuscules."""
+        assert _parse_level("debug") == logging.DEBUG
+
+    def test_niveau_invalide(self) -> None:
+        """Test qu'un niveau inconnu lève une ValueError explicite."""
+        with pytest.raises(ValueError, match="Niveau de log invalide"):
+            _parse_level("VERBOSE")
+
+
+class TestLogExecutionTime:
+    """Tests pour LogExecutionTime."""
+
+    def test_duree_calculee_en_secondes(self) -> None:
+        """Test que la durée est issue de perf_counter_ns et exprimée en secondes."""
+        logger = MagicMock()
+        with patch(
+            "backend.tools.logging_config.time.perf_counter_ns",
+            side_effect=[1_000_000_000, 3_500_000_000],
+        ):
+            with LogExecutionTime(logger, "collecte"):
+                pass
+
+        logger.info.assert_called_with(
+            "Operation completed", operation="collecte", duration_seconds=2.5
+        )
+
+    def test_echec_logge_en_erreur(self) -> None:
+        """Test qu'une exception est loggée avec sa durée puis propagée."""
+        logger = MagicMock()
+        with pytest.raises(ValueError):
+            with LogExecutionTime(logger, "analyse"):
+                raise ValueError("boom")
+
+        kwargs = logger.error.call_args.kwargs
+        assert kwargs["operation"] == "analyse"
+        assert kwargs["error"] == "boom"
+        assert kwargs["duration_seconds"] >= 0
+
+
+class TestBindRunContext:
+    """Tests pour bind_run_context."""
+
+    def test_contexte_lie_et_remplace(self) -> None:
+        """Test que chaque run repart d'un contexte neuf avec son correlation_id."""
+        bind_run_context(mode="force", ancien="oui")
+        correlation_id = bind_run_context(mode="normal")
+
+        contexte = structlog.contextvars.get_contextvars()
+        structlog.contextvars.clear_contextvars()
+
+        assert contexte == {"correlation_id": correlation_id, "mode": "normal"}
+        assert len(correlation_id) == 12
+
+
+class TestSetupFileLogging:
+    """Tests pour setup_file_logging."""
+
+    @pytest.fixture
+    def logging_isole(self, tmp_path, monkeypatch):
+        """Isole l'état global du module et nettoie listener et handlers."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(logging_config, "_INSTALLED", set())
+        monkeypatch.setattr(logging_config, "_file_listener", None)
+        root_logger = logging.getLogger()
+        avant = list(root_logger.handlers)
+
+        yield root_logger
+
+        for handler in [h for h in root_logger.handlers if h not in avant]:
+            root_logger.removeHandler(handler)
+        listener = logging_config._file_listener
+        if listener is not None:
+            atexit.unregister(listener.stop)
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+    def test_appels_repetes_sans_doublon(self, tmp_path, logging_isole) -> None:
+        """Test qu'un second appel ne rajoute pas de handler au root logger."""
+        avant = list(logging_isole.handlers)
+
+        setup_file_logging("test-app", "INFO")
+        setup_file_logging("test-app", "INFO")
+
+        nouveaux = [h for h in logging_isole.handlers if h not in avant]
+        assert len(nouveaux) == 1
+        assert isinstance(nouveaux[0], logging.handlers.QueueHandler)
+        assert (tmp_path / "logs").is_dir()
+
+    def test_exc_info_conserve_dans_fichier_erreurs(
+        self, tmp_path, logging_isole
+    ) -> None:
+        """Test que le traceback reste un champ JSON "exc_info" séparé."""
+        setup_file_logging("test-app", "INFO")
+
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logging.getLogger("test.exc").error("boom 1", exc_info=True)
+        logging_config._file_listener.queue.join()
+
+        ligne = (tmp_path / "logs" / "test-app-errors.log").read_text().splitlines()
+        enregistrement = json.loads(ligne[-1])
+        assert enregistrement["message"] == "boom 1"
+        assert enregistrement["exc_info"].startswith("Traceback")
+        assert "RuntimeError: boom" in enregistrement["exc_info"]